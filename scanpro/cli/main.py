@@ -4,13 +4,71 @@ Interactive Command Line Interface for ScanPro
 
 import sys
 import os
+import bisect
+import ipaddress
 from typing import List, Dict, Any, Optional
 
 from ..core.models import ScanConfig, ScanType, NetworkUtils
-from ..controller.scan_controller import ScanController
-from ..reporting.reporters import ReportManager
 from ..config.profiles import ScanProfiles, PortPresets, ConfigManager
 
+# Optional C patricia trie for the safe-network check
+try:
+    import pytricia
+except ImportError:
+    pytricia = None
+
+
+# Local/VM networks that can be scanned without extra confirmation
+SAFE_NETWORKS = ['127.0.0.0/8', '10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16', '::1/128']
+SAFE_HOSTNAMES = {'localhost'}
+
+
+def _build_safe_ranges(networks: List[str]) -> Dict[int, List[tuple]]:
+    """Compile networks into sorted (first, last) integer intervals per IP version"""
+    ranges = {4: [], 6: []}
+    for network in map(ipaddress.ip_network, networks):
+        ranges[network.version].append(
+            (int(network.network_address), int(network.broadcast_address))
+        )
+    return {version: sorted(intervals) for version, intervals in ranges.items()}
+
+
+def _build_safe_tries(networks: List[str]) -> Optional[Dict[int, Any]]:
+    """Compile networks into a prefix trie per IP version when pytricia is installed"""
+    if pytricia is None:
+        return None
+    
+    tries = {4: pytricia.PyTricia(32), 6: pytricia.PyTricia(128)}
+    for network in networks:
+        tries[ipaddress.ip_network(network).version][network] = True
+    return tries
+
+
+_SAFE_RANGES = _build_safe_ranges(SAFE_NETWORKS)
+_SAFE_STARTS = {version: [lo for lo, _ in intervals] for version, intervals in _SAFE_RANGES.items()}
+_SAFE_TRIES = _build_safe_tries(SAFE_NETWORKS)
+
+
+def is_safe_target(target: str) -> bool:
+    """Check whether a target falls inside a safe local/VM network"""
+    if target in SAFE_HOSTNAMES:
+        return True
+    
+    # pytricia cannot reject hostnames reliably, so validate the address first
+    if _SAFE_TRIES is not None:
+        if not NetworkUtils.is_valid_ip(target):
+            return False
+        return target in _SAFE_TRIES[6 if ':' in target else 4]
+    
+    try:
+        ip = ipaddress.ip_address(target)
+    except ValueError:
+        return False
+    
+    value = int(ip)
+    index = bisect.bisect_right(_SAFE_STARTS[ip.version], value) - 1
+    return index >= 0 and value <= _SAFE_RANGES[ip.version][index][1]
+
 
 def print_banner():
     """Print ScanPro banner"""
@@ -65,9 +123,7 @@ def prompt_targets() -> List[str]:
         
         # Parse targets
         try:
-            targets = []
-            for target in target_input.split(','):
-                targets.extend(NetworkUtils.parse_targets(target.strip()))
+            targets = list(NetworkUtils.parse_targets(target_input))
             
             if targets:
                 print(f"✅ Parsed {len(targets)} targets")
@@ -80,19 +136,8 @@ def prompt_targets() -> List[str]:
 
 def check_target_safety(targets: List[str]) -> bool:
     """Check if targets are safe and get user confirmation if needed"""
-    # Define safe local/VM networks
-    safe_networks = [
-        '127.0.0.1', '::1', 'localhost',
-        '192.168.', '10.', '172.16.', '172.17.', '172.18.', '172.19.',
-        '172.20.', '172.21.', '172.22.', '172.23.', '172.24.', '172.25.',
-        '172.26.', '172.27.', '172.28.', '172.29.', '172.30.', '172.31.'
-    ]
-    
     # Check if any targets are outside safe networks
-    unsafe_targets = []
-    for target in targets:
-        if not any(target.startswith(safe) for safe in safe_networks):
-            unsafe_targets.append(target)
+    unsafe_targets = [target for target in targets if not is_safe_target(target)]
     
     if unsafe_targets:
         print(f"\n⚠️  WARNING: External targets detected:")
@@ -122,26 +167,29 @@ def prompt_ports() -> List[int]:
     print("Available port presets:")
     
     presets = PortPresets.list_presets()
+    preset_names = tuple(presets)
+    preset_count = len(preset_names)
+    custom_choice = preset_count + 1
+    
     for i, (name, count) in enumerate(presets.items(), 1):
         print(f"  {i}. {name:<10} - {count} ports")
     
-    print(f"  {len(presets)+1}. custom     - Enter custom ports")
+    print(f"  {custom_choice}. custom     - Enter custom ports")
     
     while True:
         try:
-            choice = input(f"\nSelect option (1-{len(presets)+1}): ").strip()
+            choice = input(f"\nSelect option (1-{custom_choice}): ").strip()
             
             if choice.isdigit():
                 choice_num = int(choice)
-                preset_names = list(presets.keys())
                 
-                if 1 <= choice_num <= len(presets):
+                if 1 <= choice_num <= preset_count:
                     preset_name = preset_names[choice_num - 1]
                     ports = PortPresets.get_preset(preset_name)
                     print(f"✅ Selected {preset_name} preset ({len(ports)} ports)")
                     return ports
                 
-                elif choice_num == len(presets) + 1:
+                elif choice_num == custom_choice:
                     # Custom ports
                     print("\nEnter custom ports:")
                     print("  • Single port: 80")
@@ -162,7 +210,7 @@ def prompt_ports() -> List[int]:
                         print("❌ No valid ports found.")
                 
                 else:
-                    print(f"❌ Please enter a number between 1 and {len(presets)+1}")
+                    print(f"❌ Please enter a number between 1 and {custom_choice}")
             
             else:
                 print("❌ Please enter a valid number.")
@@ -180,31 +228,33 @@ def prompt_scan_profile() -> Optional[str]:
     print("Available scan profiles:")
     
     profiles = ScanProfiles.list_profiles()
-    profile_names = list(profiles.keys())
+    profile_names = tuple(profiles)
+    profile_count = len(profile_names)
+    custom_choice = profile_count + 1
     
     for i, (name, desc) in enumerate(profiles.items(), 1):
         print(f"  {i}. {name:<12} - {desc}")
     
-    print(f"  {len(profiles)+1}. custom      - Configure manually")
+    print(f"  {custom_choice}. custom      - Configure manually")
     
     while True:
         try:
-            choice = input(f"\nSelect profile (1-{len(profiles)+1}): ").strip()
+            choice = input(f"\nSelect profile (1-{custom_choice}): ").strip()
             
             if choice.isdigit():
                 choice_num = int(choice)
                 
-                if 1 <= choice_num <= len(profiles):
+                if 1 <= choice_num <= profile_count:
                     profile_name = profile_names[choice_num - 1]
                     print(f"✅ Selected {profile_name} profile")
                     return profile_name
                 
-                elif choice_num == len(profiles) + 1:
+                elif choice_num == custom_choice:
                     print("✅ Custom configuration selected")
                     return None
                 
                 else:
-                    print(f"❌ Please enter a number between 1 and {len(profiles)+1}")
+                    print(f"❌ Please enter a number between 1 and {custom_choice}")
             
             else:
                 print("❌ Please enter a valid number.")
@@ -315,25 +365,30 @@ def prompt_output_options() -> Dict[str, Any]:
     save_output = input("\nSave results to file? (y/n) [n]: ").strip().lower()
     if save_output in ['y', 'yes']:
         while True:
-            filename = input("Output filename (e.g., results.json, report.txt): ").strip()
+            filename = input("Output filename (e.g., results.json, results.ndjson, report.txt): ").strip()
             if filename:
                 config['output_file'] = filename
                 
                 # Determine format from extension
                 if filename.endswith('.json'):
                     config['output_format'] = 'json'
+                elif filename.endswith(('.ndjson', '.jsonl')):
+                    config['output_format'] = 'ndjson'
                 elif filename.endswith('.txt'):
                     config['output_format'] = 'text'
                 else:
                     print("Format options:")
                     print("  1. JSON")
                     print("  2. Text")
+                    print("  3. NDJSON (one host per line)")
                     
-                    format_choice = input("Select format (1-2): ").strip()
+                    format_choice = input("Select format (1-3): ").strip()
                     if format_choice == "1":
                         config['output_format'] = 'json'
                     elif format_choice == "2":
                         config['output_format'] = 'text'
+                    elif format_choice == "3":
+                        config['output_format'] = 'ndjson'
                     else:
                         print("❌ Invalid choice, defaulting to text")
                         config['output_format'] = 'text'
@@ -349,8 +404,10 @@ def prompt_output_options() -> Dict[str, Any]:
 def load_targets_from_file(filename: str) -> List[str]:
     """Load targets from file"""
     try:
+        # Read the file in one pass and strip each line only once
         with open(filename, 'r') as f:
-            targets = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            lines = (line.strip() for line in f.read().splitlines())
+            targets = [line for line in lines if line and not line.startswith('#')]
         return targets
     except FileNotFoundError:
         print(f"❌ Target file '{filename}' not found")
@@ -366,6 +423,12 @@ def interactive_scan_config() -> ScanConfig:
     # Get targets
     targets = prompt_targets()
     
+    # Drop targets that were listed more than once
+    unique_targets = NetworkUtils.deduplicate_targets(targets)
+    if len(unique_targets) < len(targets):
+        print(f"✅ Removed {len(targets) - len(unique_targets)} duplicate target(s)")
+    targets = unique_targets
+    
     # Safety check
     if not check_target_safety(targets):
         sys.exit(1)
@@ -412,32 +475,34 @@ def interactive_scan_config() -> ScanConfig:
         delay=config_dict.get('delay', 0.0),
         verbose=config_dict.get('verbose', False),
         output_format=config_dict.get('output_format', 'text'),
-        output_file=config_dict.get('output_file')
+        output_file=config_dict.get('output_file'),
+        legacy_threads=config_dict.get('legacy_threads', False)
     )
 
 
 def show_scan_summary(config: ScanConfig):
     """Display scan configuration summary"""
-    print("\n📋 SCAN SUMMARY")
-    print("-" * 14)
-    print(f"Targets:      {len(config.targets)} host(s)")
-    if len(config.targets) <= 5:
-        for target in config.targets:
-            print(f"              • {target}")
+    target_count = len(config.targets)
+    port_count = len(config.ports)
+    
+    # Build the whole summary first so it is written in one go
+    lines = ["\n📋 SCAN SUMMARY", "-" * 14, f"Targets:      {target_count} host(s)"]
+    if target_count <= 5:
+        lines.extend([f"              • {target}" for target in config.targets])
     else:
-        for target in config.targets[:3]:
-            print(f"              • {target}")
-        print(f"              ... and {len(config.targets) - 3} more")
-    
-    print(f"Ports:        {len(config.ports)} port(s)")
-    print(f"Timeout:      {config.timeout}s")
-    print(f"Threads:      {config.threads}")
-    print(f"Delay:        {config.delay}s")
-    print(f"Output:       {'Verbose' if config.verbose else 'Quiet' if hasattr(config, 'quiet') else 'Normal'}")
+        lines.extend([f"              • {target}" for target in config.targets[:3]])
+        lines.append(f"              ... and {target_count - 3} more")
+    
+    lines.append(f"Ports:        {port_count} port(s)")
+    lines.append(f"Timeout:      {config.timeout}s")
+    lines.append(f"Threads:      {config.threads}")
+    lines.append(f"Delay:        {config.delay}s")
+    lines.append(f"Output:       {'Verbose' if config.verbose else 'Quiet' if hasattr(config, 'quiet') else 'Normal'}")
     if config.output_file:
-        print(f"Save to:      {config.output_file}")
+        lines.append(f"Save to:      {config.output_file}")
     
-    print(f"\nEstimated scan time: ~{(len(config.targets) * len(config.ports) * config.timeout) / config.threads:.1f}s")
+    lines.append(f"\nEstimated scan time: ~{(target_count * port_count * config.timeout) / config.threads:.1f}s")
+    print("\n".join(lines))
 
 
 def main():
@@ -468,6 +533,10 @@ def main():
             else:
                 print("Please answer 'y' or 'n'")
         
+        # Scanner and reporting stacks are only imported once a scan is confirmed
+        from ..controller.scan_controller import ScanController
+        from ..reporting.reporters import ReportManager
+        
         # Execute scan
         print(f"\n🔍 Starting scan...")
         print("-" * 20)
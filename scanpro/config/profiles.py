@@ -2,7 +2,8 @@
 Configuration profiles and settings for ScanPro
 """
 
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Sequence
 from ..core.models import ScanType
 
 
@@ -48,6 +49,23 @@ class ScanProfiles:
             'delay': 0.0,
             'scan_type': ScanType.TCP_CONNECT,
             'description': 'Aggressive scan for maximum speed'
+        },
+        
+        'syn': {
+            'timeout': 2.0,
+            'threads': 500,
+            'delay': 0.0,
+            'scan_type': ScanType.TCP_SYN,
+            'description': 'Half-open SYN scan without full connections (requires root)'
+        },
+        
+        'threaded': {
+            'timeout': 3.0,
+            'threads': 100,
+            'delay': 0.0,
+            'scan_type': ScanType.TCP_CONNECT,
+            'legacy_threads': True,
+            'description': 'Connect scan with one blocking socket per worker thread'
         }
     }
     
@@ -69,9 +87,9 @@ class PortPresets:
     """Common port sets for scanning"""
     
     PRESETS = {
-        'top20': [21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 993, 995, 1723, 3306, 3389, 5900, 8080, 8443],
+        'top20': (21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 993, 995, 1723, 3306, 3389, 5900, 8080, 8443),
         
-        'top100': [
+        'top100': (
             7, 9, 13, 21, 22, 23, 25, 26, 37, 53, 79, 80, 81, 88, 106, 110, 111, 113, 119, 135,
             139, 143, 144, 179, 199, 389, 427, 443, 444, 445, 465, 513, 514, 515, 543, 544, 548,
             554, 587, 631, 646, 873, 990, 993, 995, 1025, 1026, 1027, 1028, 1029, 1110, 1433,
@@ -79,26 +97,32 @@ class PortPresets:
             4899, 5000, 5009, 5051, 5060, 5101, 5190, 5357, 5432, 5631, 5666, 5800, 5900, 6000,
             6001, 6646, 7070, 8000, 8008, 8009, 8080, 8081, 8443, 8888, 9100, 9999, 10000, 32768,
             49152, 49153, 49154, 49155, 49156, 49157
-        ],
+        ),
         
-        'web': [80, 443, 8000, 8008, 8080, 8081, 8443, 8888, 9000, 9090],
+        'web': (80, 443, 8000, 8008, 8080, 8081, 8443, 8888, 9000, 9090),
         
-        'mail': [25, 110, 143, 465, 587, 993, 995],
+        'mail': (25, 110, 143, 465, 587, 993, 995),
         
-        'db': [1433, 1521, 3306, 5432, 27017, 6379],
+        'db': (1433, 1521, 3306, 5432, 27017, 6379),
         
-        'remote': [22, 23, 3389, 5900, 5901, 5902],
+        'remote': (22, 23, 3389, 5900, 5901, 5902),
         
-        'all': list(range(1, 65536))
+        'all': range(1, 65536)
     }
     
     @classmethod
-    def get_preset(cls, preset_name: str) -> list:
-        """Get port preset"""
+    @functools.lru_cache(maxsize=None)
+    def get_preset(cls, preset_name: str) -> Sequence[int]:
+        """Get port preset
+        
+        Presets are immutable tuples or ranges, so the shared object is
+        returned without copying. Callers that need to modify it should
+        convert it with ``list()`` first.
+        """
         if preset_name not in cls.PRESETS:
             raise ValueError(f"Unknown preset: {preset_name}. Available: {list(cls.PRESETS.keys())}")
         
-        return cls.PRESETS[preset_name].copy()
+        return cls.PRESETS[preset_name]
     
     @classmethod
     def list_presets(cls) -> Dict[str, int]:
@@ -3,19 +3,29 @@ Scan Controller - Orchestrates scanning operations
 """
 
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..core.models import ScanConfig, HostResult, ScanResult, ScanType, NetworkUtils
+from ..core.models import ScanConfig, HostResult, ScanResult, ScanType, PortState, NetworkUtils
 from ..scanners.tcp_scanner import TCPConnectScanner
+from ..scanners.async_scanner import AsyncTCPConnectScanner
+from ..scanners.select_scanner import SelectTCPConnectScanner
+from ..scanners.syn_scanner import SYNScanner
 
 
 class ScanController:
     """Main controller for orchestrating scans"""
     
+    # Seconds a resolved hostname is reused before querying DNS again
+    DNS_CACHE_TTL = 300
+    
+    # Port sweeps larger than this use the selectors-based scanner
+    SELECT_SCANNER_MIN_PORTS = 1000
+    
     def __init__(self, config: ScanConfig):
         self.config = config
         self.results = []
+        self._dns_cache: Dict[str, Tuple[str, float]] = {}
     
     def execute_scan(self) -> List[HostResult]:
         """Execute the scan based on configuration"""
@@ -31,13 +41,37 @@ class ScanController:
         
         # Select scanner based on scan type
         if self.config.scan_type == ScanType.TCP_CONNECT:
-            scanner = TCPConnectScanner(self.config)
+            if self.config.legacy_threads:
+                scanner = TCPConnectScanner(self.config)
+            elif len(self.config.ports) > self.SELECT_SCANNER_MIN_PORTS:
+                scanner = SelectTCPConnectScanner(self.config)
+            else:
+                scanner = AsyncTCPConnectScanner(self.config)
+        elif self.config.scan_type == ScanType.TCP_SYN:
+            scanner = SYNScanner(self.config)
         else:
             raise NotImplementedError(f"Scan type {self.config.scan_type} not implemented yet")
         
+        # Classify targets once, then resolve all hostnames up front so DNS lookups overlap
+        hostnames = {target for target in self.config.targets if not NetworkUtils.is_valid_ip(target)}
+        self._prefetch_hostnames(list(hostnames))
+        
+        # Scan each target, releasing the scanner's workers afterwards
+        with scanner:
+            host_results = self._scan_targets(scanner, hostnames)
+        
+        scan_end = time.time()
+        total_time = scan_end - scan_start
+        
+        # Print final summary
+        self._print_summary(host_results, total_time)
+        
+        return host_results
+    
+    def _scan_targets(self, scanner: TCPConnectScanner, hostnames: Set[str]) -> List[HostResult]:
+        """Scan every configured target in turn, printing per-host findings"""
         host_results = []
         
-        # Scan each target
         for i, target in enumerate(self.config.targets, 1):
             print(f"[*] Scanning target {i}/{len(self.config.targets)}: {target}")
             
@@ -45,8 +79,8 @@ class ScanController:
             
             # Resolve hostname if needed
             resolved_ip = target
-            if not NetworkUtils.is_valid_ip(target):
-                resolved_ip = NetworkUtils.resolve_hostname(target)
+            if target in hostnames:
+                resolved_ip = self._resolve_hostname(target)
                 if not resolved_ip:
                     print(f"[-] Could not resolve hostname: {target}")
                     continue
@@ -64,13 +98,13 @@ class ScanController:
                 ports=port_results,
                 scan_start=target_start,
                 scan_end=target_end,
-                is_alive=any(result and result.state and result.state.value == "open" for result in port_results)
+                is_alive=any(result and result.state is PortState.OPEN for result in port_results)
             )
             
             host_results.append(host_result)
             
             # Print summary for this host
-            open_ports = [r for r in port_results if r and r.state and r.state.value == "open"]
+            open_ports = [r for r in port_results if r and r.state is PortState.OPEN]
             if open_ports:
                 print(f"[+] Found {len(open_ports)} open ports on {target}")
                 for result in open_ports:
@@ -82,44 +116,78 @@ class ScanController:
             
             print()
         
-        scan_end = time.time()
-        total_time = scan_end - scan_start
+        return host_results
+    
+    def _resolve_hostname(self, hostname: str) -> Optional[str]:
+        """Resolve hostname to IP address, reusing cached answers until they expire"""
+        now = time.time()
+        cached = self._dns_cache.get(hostname)
+        if cached and now < cached[1]:
+            return cached[0]
         
-        # Print final summary
-        self._print_summary(host_results, total_time)
+        resolved_ip = NetworkUtils.resolve_hostname(hostname)
+        if resolved_ip:
+            self._dns_cache[hostname] = (resolved_ip, now + self.DNS_CACHE_TTL)
+        return resolved_ip
+    
+    def _prefetch_hostnames(self, hostnames: List[str]):
+        """Resolve hostnames concurrently and store the answers in the DNS cache"""
+        hostnames = [h for h in dict.fromkeys(hostnames) if h not in self._dns_cache]
+        if not hostnames:
+            return
         
-        return host_results
+        with ThreadPoolExecutor(max_workers=min(32, len(hostnames))) as executor:
+            resolved = executor.map(NetworkUtils.resolve_hostname, hostnames)
+            expiry = time.time() + self.DNS_CACHE_TTL
+            for hostname, resolved_ip in zip(hostnames, resolved):
+                if resolved_ip:
+                    self._dns_cache[hostname] = (resolved_ip, expiry)
     
     def _print_summary(self, results: List[HostResult], scan_time: float):
         """Print scan summary"""
-        print("=" * 60)
-        print("SCAN SUMMARY")
-        print("=" * 60)
+        # Build the whole summary first so it is written in one go
+        lines = ["=" * 60, "SCAN SUMMARY", "=" * 60]
         
         if not results:
-            print("No scan results to display")
-            print("=" * 60)
+            lines.append("No scan results to display")
+            lines.append("=" * 60)
+            print("\n".join(lines))
             return
         
+        # Gather all counts in a single pass over the results
         total_hosts = len(results)
-        live_hosts = len([r for r in results if r.is_alive])
-        total_ports_scanned = sum(len(r.ports) for r in results if r.ports)
-        total_open_ports = sum(len([p for p in r.ports if p and p.state and p.state.value == "open"]) for r in results if r.ports)
+        live_hosts = 0
+        total_ports_scanned = 0
+        total_open_ports = 0
+        open_by_host = []
+        state_open = PortState.OPEN
+        
+        for result in results:
+            if result.is_alive:
+                live_hosts += 1
+            
+            ports = result.ports
+            if not ports:
+                continue
+            
+            total_ports_scanned += len(ports)
+            open_ports = [p.port for p in ports if p and p.state is state_open]
+            if open_ports:
+                total_open_ports += len(open_ports)
+                open_by_host.append((result.host, open_ports))
         
-        print(f"Scan completed in {scan_time:.2f} seconds")
-        print(f"Hosts scanned: {total_hosts}")
-        print(f"Live hosts: {live_hosts}")
-        print(f"Total ports scanned: {total_ports_scanned}")
-        print(f"Open ports found: {total_open_ports}")
+        lines.append(f"Scan completed in {scan_time:.2f} seconds")
+        lines.append(f"Hosts scanned: {total_hosts}")
+        lines.append(f"Live hosts: {live_hosts}")
+        lines.append(f"Total ports scanned: {total_ports_scanned}")
+        lines.append(f"Open ports found: {total_open_ports}")
         
         if total_open_ports > 0:
-            print(f"\nOpen ports by host:")
-            for result in results:
-                if not result.ports:
-                    continue
-                open_ports = [p for p in result.ports if p and p.state and p.state.value == "open"]
-                if open_ports:
-                    ports_str = ", ".join([f"{p.port}/tcp" for p in open_ports])
-                    print(f"  {result.host}: {ports_str}")
+            lines.append(f"\nOpen ports by host:")
+            lines.extend([
+                f"  {host}: " + ", ".join([f"{port}/tcp" for port in open_ports])
+                for host, open_ports in open_by_host
+            ])
         
-        print("=" * 60)
+        lines.append("=" * 60)
+        print("\n".join(lines))
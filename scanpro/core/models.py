@@ -4,9 +4,38 @@ Core utilities and shared types for ScanPro
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 import ipaddress
+import itertools
+import operator
 import re
+import socket
+import struct
+import sys
+
+# Packs an integer IPv4 address into network byte order for inet_ntoa
+_pack_ipv4 = struct.Struct('!I').pack
+_unpack_ipv4 = struct.Struct('!I').unpack
+
+# IPv6 addresses below this may be formatted in dotted IPv4 form by inet_ntop
+_IPV6_NTOP_MIN = 1 << 48
+
+# Number of distinct TCP/UDP port numbers (0-65535)
+_PORT_COUNT = 65536
+
+# Port presets accepted by parse_ports, built once at import
+_PORT_PRESETS = {
+    'top100': (21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 993, 995, 1723, 3306, 3389, 5900, 8080),
+    'top1000': range(1, 1001),
+    'all': range(1, _PORT_COUNT)
+}
+
+# Cheap shape checks that reject hostnames before calling inet_pton
+_IPV4_RE = re.compile(r'^(?:\d{1,3}\.){3}\d{1,3}$')
+_IPV6_RE = re.compile(r'^[0-9a-fA-F]*:[0-9a-fA-F:.]*$')
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 class ScanType(Enum):
     """Enumeration of available scan types"""
@@ -22,7 +51,7 @@ class PortState(Enum):
     FILTERED = "filtered"
     UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScanResult:
     """Data class for individual port scan results"""
     host: str
@@ -33,7 +62,7 @@ class ScanResult:
     scan_time: Optional[float] = None
     error: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class HostResult:
     """Data class for host scan results"""
     host: str
@@ -42,9 +71,9 @@ class HostResult:
     scan_end: float
     is_alive: bool = True
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ScanConfig:
-    """Configuration for scan parameters"""
+    """Configuration for scan parameters (immutable once created)"""
     targets: List[str]
     ports: List[int]
     scan_type: ScanType = ScanType.TCP_CONNECT
@@ -54,59 +83,130 @@ class ScanConfig:
     verbose: bool = False
     output_format: str = "json"
     output_file: Optional[str] = None
+    legacy_threads: bool = False  # Use the thread-per-connection scanner
 
 class NetworkUtils:
     """Utility functions for network operations"""
     
     @staticmethod
-    def parse_targets(target_str: str) -> List[str]:
-        """Parse target string into list of IP addresses"""
-        targets = []
+    def parse_targets(target_str: str) -> Iterator[str]:
+        """Parse target string into IP addresses, yielding hosts lazily
         
+        CIDR blocks and IP ranges are expanded one host at a time so large
+        networks are never materialised up front. Wrap the result in
+        ``list()`` when a sized, reusable sequence is needed.
+        """
         for target in target_str.split(','):
             target = target.strip()
             
             if '/' in target:  # CIDR notation
                 try:
                     network = ipaddress.ip_network(target, strict=False)
-                    targets.extend([str(ip) for ip in network.hosts()])
                 except ValueError:
                     print(f"Invalid CIDR notation: {target}")
                     continue
+                first = int(network.network_address)
+                last = int(network.broadcast_address)
+                if network.version == 4:
+                    if network.prefixlen < 31:  # Skip network and broadcast addresses
+                        first, last = first + 1, last - 1
+                    yield from NetworkUtils.ipv4_range(first, last)
+                else:
+                    if network.prefixlen < 127:  # Skip the Subnet-Router anycast address
+                        first += 1
+                    yield from NetworkUtils.ipv6_range(first, last)
             
-            elif '-' in target and target.count('.') == 3:  # IP range
+            elif '-' in target and _IPV4_RE.match(target.split('-', 1)[0].strip()):  # IP range
                 try:
-                    start_ip, end_ip = target.split('-')
-                    start = ipaddress.IPv4Address(start_ip.strip())
-                    end = ipaddress.IPv4Address(end_ip.strip())
-                    
-                    current = start
-                    while current <= end:
-                        targets.append(str(current))
-                        current += 1
+                    start_ip, end_ip = (part.strip() for part in target.split('-'))
+                    if '.' not in end_ip:  # Short form: 192.168.1.1-10
+                        end_ip = start_ip.rsplit('.', 1)[0] + '.' + end_ip
+                    start = int(ipaddress.IPv4Address(start_ip))
+                    end = int(ipaddress.IPv4Address(end_ip))
                 except ValueError:
                     print(f"Invalid IP range: {target}")
                     continue
+                yield from NetworkUtils.ipv4_range(start, end)
             
             else:  # Single IP or hostname
-                targets.append(target)
+                yield target
+    
+    @staticmethod
+    def ipv4_range(start: int, end: int) -> Iterator[str]:
+        """Yield dotted-quad strings for an inclusive range of integer IPv4 addresses
+        
+        Formatting is done by inet_ntoa in C rather than by building an
+        IPv4Address object per host.
+        """
+        return map(socket.inet_ntoa, map(_pack_ipv4, range(start, end + 1)))
+    
+    @staticmethod
+    def ipv6_range(start: int, end: int) -> Iterator[str]:
+        """Yield compressed strings for an inclusive range of integer IPv6 addresses
+        
+        Output matches str(IPv6Address). Ranges under ::1:0:0:0 are left to
+        ipaddress because inet_ntop writes IPv4-mapped and IPv4-compatible
+        addresses in dotted form there.
+        """
+        if start < _IPV6_NTOP_MIN:
+            return map(str, map(ipaddress.IPv6Address, range(start, end + 1)))
+        return (socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, 'big'))
+                for value in range(start, end + 1))
+    
+    @staticmethod
+    def deduplicate_targets(targets: Iterable[str]) -> List[str]:
+        """Remove duplicate targets, keeping IP addresses in ascending order
+        
+        IP addresses are returned in ascending order followed by hostnames in
+        their original order. IPv4 addresses are compared as integers and only
+        sorted if they did not already arrive in order, as expanded ranges do.
+        """
+        ipv4 = []
+        ipv6 = []
+        hostnames = {}
         
-        return targets
+        for target in targets:
+            if _IPV4_RE.match(target):
+                try:
+                    ipv4.append(_unpack_ipv4(socket.inet_pton(socket.AF_INET, target))[0])
+                    continue
+                except OSError:
+                    pass
+            try:
+                ipv6.append(ipaddress.IPv6Address(target))
+            except ValueError:
+                hostnames[target] = None
+        
+        unique_ipv4 = dict.fromkeys(ipv4)
+        if not all(map(operator.le, ipv4, itertools.islice(ipv4, 1, None))):
+            unique_ipv4 = sorted(unique_ipv4)
+        
+        unique = list(map(socket.inet_ntoa, map(_pack_ipv4, unique_ipv4)))
+        for network in ipaddress.collapse_addresses(ipv6):
+            unique.extend(NetworkUtils.ipv6_range(int(network.network_address),
+                                                  int(network.broadcast_address)))
+        unique.extend(hostnames)
+        
+        return unique
     
     @staticmethod
-    def parse_ports(port_str: str) -> List[int]:
-        """Parse port string into list of port numbers"""
-        ports = []
+    def parse_ports(port_str: str) -> Sequence[int]:
+        """Parse port string into sorted sequence of unique port numbers
         
+        Presets are returned as shared immutable tuples or ranges.
+        """
         # Common port presets
-        presets = {
-            'top100': [21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 993, 995, 1723, 3306, 3389, 5900, 8080],
-            'top1000': list(range(1, 1001)),
-            'all': list(range(1, 65536))
-        }
+        preset = _PORT_PRESETS.get(port_str.lower())
+        if preset is not None:
+            return preset
         
-        if port_str.lower() in presets:
-            return presets[port_str.lower()]
+        intervals = NetworkUtils.parse_port_intervals(port_str)
+        return list(itertools.chain.from_iterable(range(lo, hi + 1) for lo, hi in intervals))
+    
+    @staticmethod
+    def parse_port_intervals(port_str: str) -> List[Tuple[int, int]]:
+        """Parse port string into sorted, disjoint (first, last) port intervals"""
+        intervals = []
         
         for port_range in port_str.split(','):
             port_range = port_range.strip()
@@ -114,26 +214,51 @@ class NetworkUtils:
             if '-' in port_range:
                 try:
                     start, end = map(int, port_range.split('-'))
-                    ports.extend(range(start, end + 1))
                 except ValueError:
                     print(f"Invalid port range: {port_range}")
                     continue
+                if not (0 <= start < _PORT_COUNT and 0 <= end < _PORT_COUNT):
+                    print(f"Invalid port range: {port_range}")
+                    continue
+                if start <= end:
+                    intervals.append((start, end))
             else:
                 try:
-                    ports.append(int(port_range))
+                    port = int(port_range)
                 except ValueError:
                     print(f"Invalid port number: {port_range}")
                     continue
+                if not 0 <= port < _PORT_COUNT:
+                    print(f"Invalid port number: {port_range}")
+                    continue
+                intervals.append((port, port))
         
-        return sorted(list(set(ports)))  # Remove duplicates and sort
+        # Merge overlapping and adjacent intervals in a single sorted pass
+        intervals.sort()
+        merged = []
+        for lo, hi in intervals:
+            if merged and lo <= merged[-1][1] + 1:
+                if hi > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], hi)
+            else:
+                merged.append((lo, hi))
+        
+        return merged
     
     @staticmethod
     def is_valid_ip(ip: str) -> bool:
         """Check if string is a valid IP address"""
+        if _IPV4_RE.match(ip):
+            family = socket.AF_INET
+        elif _IPV6_RE.match(ip):
+            family = socket.AF_INET6
+        else:
+            return False
+        
         try:
-            ipaddress.ip_address(ip)
+            socket.inet_pton(family, ip)
             return True
-        except ValueError:
+        except OSError:
             return False
     
     @staticmethod
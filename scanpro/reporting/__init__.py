@@ -2,6 +2,11 @@
 Reporting package
 """
 
-from .reporters import JSONReporter, TextReporter, ReportManager
+from .reporters import (
+    JSONReporter, NDJSONReporter, TextReporter, ReportManager, dumps_json, dumps_json_line
+)
 
-__all__ = ['JSONReporter', 'TextReporter', 'ReportManager']
+__all__ = [
+    'JSONReporter', 'NDJSONReporter', 'TextReporter', 'ReportManager',
+    'dumps_json', 'dumps_json_line'
+]
@@ -4,10 +4,34 @@ Reporting and output formatting for scan results
 
 import json
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from pathlib import Path
 
-from ..core.models import HostResult, ScanResult
+from ..core.models import HostResult, ScanResult, PortState
+
+# Optional C JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Port states compared by identity and their report strings, looked up once
+_OPEN = PortState.OPEN
+_STATE_STR = {state: state.value for state in PortState}
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialise obj as JSON indented by 2 spaces, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def dumps_json_line(obj: Any) -> str:
+    """Serialise obj as compact single-line JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(',', ':'))
 
 
 class JSONReporter:
@@ -18,11 +42,44 @@ class JSONReporter:
         """Generate JSON report from scan results"""
         current_time = time.time()
         
+        report = JSONReporter._report_header(results, config, current_time)
+        report["hosts"] = [JSONReporter._host_data(h, current_time) for h in results]
+        
+        return report
+    
+    @staticmethod
+    def iter_report(results: List[HostResult], config: Dict[str, Any] = None) -> Iterator[str]:
+        """Generate the JSON report text in chunks, one host at a time
+        
+        The output is identical to ``dumps_json(generate_report(...))`` but
+        only a single host's data is held in memory at once.
+        """
+        current_time = time.time()
+        
+        report = JSONReporter._report_header(results, config, current_time)
+        report["hosts"] = []
+        
+        # The header always ends with the empty hosts list: '[]\n}'
+        header = dumps_json(report)
+        if not results:
+            yield header
+            return
+        
+        yield header[:-len("]\n}")]
+        for i, host_result in enumerate(results):
+            host_json = dumps_json(JSONReporter._host_data(host_result, current_time))
+            yield ("," if i else "") + "\n    " + host_json.replace("\n", "\n    ")
+        yield "\n  ]\n}"
+    
+    @staticmethod
+    def _report_header(results: List[HostResult], config: Dict[str, Any],
+                       current_time: float) -> Dict[str, Any]:
+        """Build the report fields that summarise the whole scan"""
         # Filter out None values for start/end times
         valid_start_times = [r.scan_start for r in results if r.scan_start is not None]
         valid_end_times = [r.scan_end for r in results if r.scan_end is not None]
         
-        report = {
+        return {
             "scanpro_version": "1.0.0",
             "scan_info": {
                 "start_time": min(valid_start_times) if valid_start_times else current_time,
@@ -30,46 +87,40 @@ class JSONReporter:
                 "total_hosts": len(results),
                 "total_ports_scanned": sum(len(r.ports) for r in results if r.ports),
                 "scan_config": config or {}
-            },
-            "hosts": []
+            }
         }
+    
+    @staticmethod
+    def _host_data(host_result: HostResult, current_time: float) -> Dict[str, Any]:
+        """Build the report entry for a single host"""
+        scan_duration = 0
+        if host_result.scan_start is not None and host_result.scan_end is not None:
+            scan_duration = host_result.scan_end - host_result.scan_start
         
-        for host_result in results:
-            scan_duration = 0
-            if host_result.scan_start is not None and host_result.scan_end is not None:
-                scan_duration = host_result.scan_end - host_result.scan_start
-                
-            host_data = {
-                "host": host_result.host,
-                "scan_start": host_result.scan_start or current_time,
-                "scan_end": host_result.scan_end or current_time,
-                "scan_duration": scan_duration,
-                "is_alive": host_result.is_alive,
-                "ports": []
-            }
-            
-            for port_result in host_result.ports:
-                port_data = {
+        return {
+            "host": host_result.host,
+            "scan_start": host_result.scan_start or current_time,
+            "scan_end": host_result.scan_end or current_time,
+            "scan_duration": scan_duration,
+            "is_alive": host_result.is_alive,
+            "ports": [
+                {
                     "port": port_result.port,
-                    "state": port_result.state.value,
+                    "state": _STATE_STR[port_result.state],
                     "service": port_result.service,
                     "banner": port_result.banner,
                     "scan_time": port_result.scan_time,
                     "error": port_result.error
                 }
-                host_data["ports"].append(port_data)
-            
-            report["hosts"].append(host_data)
-        
-        return report
+                for port_result in host_result.ports
+            ]
+        }
     
     @staticmethod
     def save_report(results: List[HostResult], filename: str, config: Dict[str, Any] = None):
-        """Save JSON report to file"""
-        report = JSONReporter.generate_report(results, config)
-        
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        """Save JSON report to file, streaming it one host at a time"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.writelines(JSONReporter.iter_report(results, config))
         
         print(f"[*] JSON report saved to: {filename}")
 
@@ -95,14 +146,17 @@ class TextReporter:
             lines.append(f"Scan Duration: {scan_duration:.2f}s")
             lines.append("")
             
-            open_ports = [p for p in host_result.ports if p and p.state and p.state.value == "open"]
-            
-            if open_ports:
-                lines.append("Open Ports:")
-                for port in open_ports:
+            # Format open ports in the same pass that filters them
+            port_lines = []
+            for port in host_result.ports:
+                if port and port.state is _OPEN:
                     service_info = f" ({port.service})" if port.service else ""
                     banner_info = f" - {port.banner}" if port.banner else ""
-                    lines.append(f"  {port.port}/tcp{service_info}{banner_info}")
+                    port_lines.append(f"  {port.port}/tcp{service_info}{banner_info}")
+            
+            if port_lines:
+                lines.append("Open Ports:")
+                lines.extend(port_lines)
             else:
                 lines.append("No open ports found")
             
@@ -123,12 +177,38 @@ class TextReporter:
         print(f"[*] Text report saved to: {filename}")
 
 
+class NDJSONReporter:
+    """Newline-delimited JSON reporter, one host per line"""
+    
+    @staticmethod
+    def iter_report(results: List[HostResult]) -> Iterator[str]:
+        """Generate one JSON line per host, each ending in a newline"""
+        current_time = time.time()
+        for host_result in results:
+            yield dumps_json_line(JSONReporter._host_data(host_result, current_time)) + "\n"
+    
+    @staticmethod
+    def generate_report(results: List[HostResult]) -> str:
+        """Generate NDJSON report"""
+        return "".join(NDJSONReporter.iter_report(results))
+    
+    @staticmethod
+    def save_report(results: List[HostResult], filename: str):
+        """Save NDJSON report to file, writing each host as it is encoded"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.writelines(NDJSONReporter.iter_report(results))
+        
+        print(f"[*] NDJSON report saved to: {filename}")
+
+
 class ReportManager:
     """Manages different report formats"""
     
     def __init__(self):
         self.reporters = {
             'json': JSONReporter,
+            'ndjson': NDJSONReporter,
+            'jsonl': NDJSONReporter,
             'text': TextReporter,
             'txt': TextReporter
         }
@@ -152,7 +232,7 @@ class ReportManager:
             # Print to console
             if format_type == 'json':
                 report = reporter.generate_report(results, config)
-                print(json.dumps(report, indent=2))
+                print(dumps_json(report))
             else:
                 report = reporter.generate_report(results)
-                print(report)
+                print(report, end='' if reporter is NDJSONReporter else '\n')
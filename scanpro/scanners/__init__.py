@@ -3,5 +3,8 @@ Scanner modules for different scan types
 """
 
 from .tcp_scanner import TCPConnectScanner
+from .async_scanner import AsyncTCPConnectScanner
+from .select_scanner import SelectTCPConnectScanner
+from .syn_scanner import SYNScanner
 
-__all__ = ['TCPConnectScanner']
+__all__ = ['TCPConnectScanner', 'AsyncTCPConnectScanner', 'SelectTCPConnectScanner', 'SYNScanner']
@@ -0,0 +1,161 @@
+"""
+Asyncio TCP Connect Scanner Implementation
+"""
+
+import asyncio
+import socket
+import sys
+import time
+from typing import Iterator, List, Optional
+
+from ..core.models import ScanResult, PortState
+from .tcp_scanner import TCPConnectScanner
+
+# Optional libuv-based event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _use_uvloop() -> bool:
+    """Check whether scans may run on uvloop
+    
+    libuv blocks in its own epoll call, which gevent cannot switch away
+    from, so under gevent's monkey patching the stdlib loop is used.
+    """
+    if uvloop is None:
+        return False
+    monkey = sys.modules.get('gevent.monkey')
+    return monkey is None or not monkey.is_module_patched('socket')
+
+
+class AsyncTCPConnectScanner(TCPConnectScanner):
+    """TCP Connect Scanner driving all connections from a single event loop
+    
+    Concurrency is bounded by ``config.threads`` worker coroutines sharing
+    one port iterator, instead of one OS thread or task per connection.
+    """
+    
+    def scan_host(self, host: str, ports: List[int]) -> List[ScanResult]:
+        """Scan multiple ports on a single host"""
+        # Resolve hostname once rather than per port
+        try:
+            host = self._resolve(host)
+        except Exception as e:
+            return self._unresolved_results(host, ports, str(e))
+        
+        if _use_uvloop():
+            return uvloop.run(self._scan_host_async(host, ports))
+        return asyncio.run(self._scan_host_async(host, ports))
+    
+    async def _scan_host_async(self, host: str, ports: List[int]) -> List[ScanResult]:
+        """Scan ports concurrently, bounded by the configured thread count"""
+        host_results = []
+        pending = iter(ports)
+        workers = max(1, min(self.config.threads, len(ports)))
+        
+        await asyncio.gather(*[
+            self._scan_worker(host, pending, host_results) for _ in range(workers)
+        ])
+        
+        return host_results
+    
+    async def _scan_worker(self, host: str, pending: Iterator[int],
+                           host_results: List[ScanResult]):
+        """Scan ports from the shared iterator until it is exhausted"""
+        verbose = self.config.verbose
+        delay = self.config.delay
+        
+        for port in pending:
+            result = await self._connect(host, port)
+            host_results.append(result)
+            
+            if verbose and result.state is PortState.OPEN:
+                print(f"[+] {result.host}:{result.port} - {result.state.value}")
+            
+            # Space out requests if a delay is specified
+            if delay > 0:
+                await asyncio.sleep(delay)
+    
+    async def _connect(self, host: str, port: int) -> ScanResult:
+        """Attempt a full TCP connection and grab a banner if the port is open"""
+        start_time = time.time()
+        
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), self.config.timeout
+            )
+        except asyncio.TimeoutError:
+            return ScanResult(
+                host=host,
+                port=port,
+                state=PortState.FILTERED,
+                scan_time=time.time() - start_time,
+                error="Timeout"
+            )
+        except socket.gaierror as e:
+            return ScanResult(
+                host=host,
+                port=port,
+                state=PortState.UNKNOWN,
+                scan_time=time.time() - start_time,
+                error=str(e)
+            )
+        except OSError:
+            # Connection refused or unreachable - port is closed
+            return ScanResult(
+                host=host,
+                port=port,
+                state=PortState.CLOSED,
+                scan_time=time.time() - start_time
+            )
+        except Exception as e:
+            return ScanResult(
+                host=host,
+                port=port,
+                state=PortState.UNKNOWN,
+                scan_time=time.time() - start_time,
+                error=str(e)
+            )
+        
+        # Connection successful - port is open
+        scan_time = time.time() - start_time
+        self._tune_socket(writer.get_extra_info('socket'))
+        banner = await self._grab_banner_async(reader, writer, port)
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        
+        return ScanResult(
+            host=host,
+            port=port,
+            state=PortState.OPEN,
+            service=self._get_service_name(port),
+            banner=banner,
+            scan_time=scan_time
+        )
+    
+    async def _grab_banner_async(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter, port: int) -> Optional[str]:
+        """Attempt to grab banner from open port"""
+        plan = self._banner_probe(port)
+        if plan is None:
+            return None
+        
+        try:
+            # Send appropriate probe based on port
+            probe, timeout = plan
+            if probe:
+                writer.write(probe)
+                await writer.drain()
+            
+            # Try to receive banner
+            data = await asyncio.wait_for(reader.read(1024), timeout)
+            return self._clean_banner(data)
+        
+        except Exception:
+            return None
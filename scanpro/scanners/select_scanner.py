@@ -0,0 +1,181 @@
+"""
+Non-blocking TCP Connect Scanner Implementation using selectors
+"""
+
+import errno
+import selectors
+import socket
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from ..core.models import ScanResult, PortState
+from .tcp_scanner import TCPConnectScanner
+
+# connect_ex results meaning the handshake is still in progress
+_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY}
+
+
+class _Probe:
+    """In-flight connection attempt tracked by the selector"""
+    
+    __slots__ = ('sock', 'fd', 'port', 'start_time', 'deadline', 'scan_time')
+    
+    def __init__(self, sock: socket.socket, port: int, start_time: float, deadline: float):
+        self.sock = sock
+        self.fd = sock.fileno()
+        self.port = port
+        self.start_time = start_time
+        self.deadline = deadline
+        self.scan_time: Optional[float] = None  # Set once connected
+
+
+class SelectTCPConnectScanner(TCPConnectScanner):
+    """TCP Connect Scanner multiplexing raw non-blocking sockets
+    
+    Keeps a sliding window of ``config.threads`` outstanding connects and
+    polls them with the platform's best selector (epoll/kqueue), avoiding
+    per-connection task scheduling on very large port sweeps.
+    """
+    
+    def scan_host(self, host: str, ports: List[int]) -> List[ScanResult]:
+        """Scan multiple ports on a single host"""
+        # Resolve hostname once rather than per port
+        try:
+            host = self._resolve(host)
+        except Exception as e:
+            return self._unresolved_results(host, ports, str(e))
+        
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
+        timeout = self.config.timeout
+        delay = self.config.delay
+        window = max(1, self.config.threads)  # A zero window would never send a probe
+        verbose = self.config.verbose
+        
+        host_results = []
+        banner_buffer = memoryview(bytearray(1024))  # Reused by every banner read
+        active: Dict[int, _Probe] = {}
+        cooling = deque()  # Times at which slots held back by the delay free up
+        pending = iter(ports)
+        exhausted = False
+        
+        def record(port: int, state: PortState, scan_time: float,
+                   banner: Optional[str] = None, error: Optional[str] = None):
+            result = ScanResult(
+                host=host,
+                port=port,
+                state=state,
+                service=self._get_service_name(port) if state is PortState.OPEN else None,
+                banner=banner,
+                scan_time=scan_time,
+                error=error
+            )
+            host_results.append(result)
+            
+            # Space out requests if a delay is specified
+            if delay > 0:
+                cooling.append(time.time() + delay)
+            
+            if verbose and state is PortState.OPEN:
+                print(f"[+] {result.host}:{result.port} - {result.state.value}")
+        
+        def finish(probe: _Probe, state: PortState, banner: Optional[str] = None,
+                   error: Optional[str] = None):
+            selector.unregister(probe.sock)
+            probe.sock.close()
+            del active[probe.fd]
+            
+            scan_time = probe.scan_time
+            if scan_time is None:
+                scan_time = time.time() - probe.start_time
+            record(probe.port, state, scan_time, banner, error)
+        
+        def start(port: int):
+            start_time = time.time()
+            try:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+            except OSError as e:
+                record(port, PortState.UNKNOWN, time.time() - start_time, error=str(e))
+                return
+            
+            sock.setblocking(False)
+            self._tune_socket(sock)
+            result = sock.connect_ex((host, port))
+            if result not in _IN_PROGRESS:
+                # Connection refused straight away - port is closed
+                sock.close()
+                record(port, PortState.CLOSED, time.time() - start_time)
+                return
+            
+            probe = _Probe(sock, port, start_time, start_time + timeout)
+            active[probe.fd] = probe
+            selector.register(sock, selectors.EVENT_WRITE)
+        
+        with selectors.DefaultSelector() as selector:
+            while True:
+                now = time.time()
+                while cooling and cooling[0] <= now:
+                    cooling.popleft()
+                
+                # Top up the window of outstanding connects
+                while not exhausted and len(active) + len(cooling) < window:
+                    port = next(pending, None)
+                    if port is None:
+                        exhausted = True
+                    else:
+                        start(port)
+                
+                if not active:
+                    if not cooling:
+                        if exhausted:
+                            break
+                        continue
+                    time.sleep(max(0.0, cooling[0] - time.time()))
+                    continue
+                
+                wait = min(probe.deadline for probe in active.values()) - time.time()
+                if cooling:
+                    wait = min(wait, cooling[0] - time.time())
+                
+                for key, _ in selector.select(max(0.0, wait)):
+                    probe = active[key.fd]
+                    
+                    if probe.scan_time is None:
+                        # Handshake finished - check whether it succeeded
+                        if probe.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                            finish(probe, PortState.CLOSED)
+                            continue
+                        
+                        # Connection successful - port is open, wait for a banner
+                        probe.scan_time = time.time() - probe.start_time
+                        plan = self._banner_probe(probe.port)
+                        if plan is None:
+                            finish(probe, PortState.OPEN)
+                            continue
+                        
+                        data, banner_timeout = plan
+                        probe.deadline = time.time() + banner_timeout
+                        try:
+                            if data:
+                                probe.sock.send(data)
+                        except OSError:
+                            pass
+                        selector.modify(probe.sock, selectors.EVENT_READ)
+                    
+                    else:
+                        try:
+                            received = probe.sock.recv_into(banner_buffer)
+                            banner = self._clean_banner(banner_buffer[:received])
+                        except OSError:
+                            banner = None
+                        finish(probe, PortState.OPEN, banner)
+                
+                # Expire connects and banner reads that ran out of time
+                now = time.time()
+                for probe in [p for p in active.values() if p.deadline <= now]:
+                    if probe.scan_time is None:
+                        finish(probe, PortState.FILTERED, error="Timeout")
+                    else:
+                        finish(probe, PortState.OPEN)
+        
+        return host_results
@@ -0,0 +1,194 @@
+"""
+TCP SYN (half-open) Scanner Implementation using raw sockets
+"""
+
+import random
+import select
+import socket
+import struct
+import time
+from typing import Dict, List, Optional
+
+from ..core.models import ScanResult, PortState, ScanConfig
+from .tcp_scanner import TCPConnectScanner
+
+# TCP header flags
+_SYN = 0x02
+_RST = 0x04
+_ACK = 0x10
+
+# Source port, destination port, sequence, acknowledgement, data offset,
+# flags, window, checksum, urgent pointer
+_TCP_HEADER = struct.Struct('!HHIIBBHHH')
+
+# Source address, destination address, zero, protocol, TCP length
+_PSEUDO_HEADER = struct.Struct('!4s4sBBH')
+
+# Leading reply fields: source port, destination port, sequence, acknowledgement
+_TCP_REPLY = struct.Struct('!HHII')
+
+# Window size advertised in probe SYNs
+_SYN_WINDOW = 1024
+
+# Receive buffer requested for the raw socket, which sees every inbound TCP packet
+_RECV_BUFFER = 4 * 1024 * 1024
+
+
+def _checksum(data: bytes) -> int:
+    """Compute the Internet checksum (RFC 1071) of data"""
+    if len(data) % 2:
+        data += b'\0'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    while total >> 16:
+        total = (total & 0xffff) + (total >> 16)
+    return ~total & 0xffff
+
+
+def _syn_packet(src: bytes, dst: bytes, sport: int, dport: int, seq: int) -> bytes:
+    """Build a TCP SYN header with a valid checksum"""
+    header = _TCP_HEADER.pack(sport, dport, seq, 0, 5 << 4, _SYN, _SYN_WINDOW, 0, 0)
+    pseudo = _PSEUDO_HEADER.pack(src, dst, 0, socket.IPPROTO_TCP, len(header))
+    checksum = _checksum(pseudo + header)
+    return _TCP_HEADER.pack(sport, dport, seq, 0, 5 << 4, _SYN, _SYN_WINDOW, checksum, 0)
+
+
+class SYNScanner(TCPConnectScanner):
+    """TCP SYN scanner that never completes the three-way handshake
+    
+    A bare SYN is sent per port and the reply classifies it: SYN/ACK means
+    open, RST means closed and silence means filtered. The kernel resets
+    the half-open connection itself since no local socket owns the source
+    port. Up to ``config.threads`` probes are outstanding at once.
+    
+    Requires root (CAP_NET_RAW) and IPv4 targets.
+    """
+    
+    def __init__(self, config: ScanConfig):
+        super().__init__(config)
+        
+        # Fail before any target is scanned if raw sockets are unavailable
+        try:
+            socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP).close()
+        except PermissionError:
+            raise PermissionError("SYN scan requires root privileges (CAP_NET_RAW)") from None
+    
+    def scan_host(self, host: str, ports: List[int]) -> List[ScanResult]:
+        """Scan multiple ports on a single host"""
+        # Resolve hostname once rather than per port
+        try:
+            host = self._resolve(host)
+        except Exception as e:
+            return self._unresolved_results(host, ports, str(e))
+        
+        # Raw SYNs are built for IPv4 only; other targets are reported, not scanned
+        if ':' in host:
+            return self._unresolved_results(host, ports, "SYN scan supports IPv4 targets only")
+        
+        try:
+            dst = socket.inet_aton(host)
+            src = socket.inet_aton(self._source_address(host))
+        except OSError as e:
+            return self._unresolved_results(host, ports, str(e))
+        
+        timeout = self.config.timeout
+        delay = self.config.delay
+        window = max(1, self.config.threads)  # A zero window would never send a SYN
+        verbose = self.config.verbose
+        sport = random.randint(32768, 60999)
+        seq = random.getrandbits(32)
+        expected_ack = (seq + 1) & 0xffffffff
+        
+        host_results = []
+        outstanding: Dict[int, float] = {}  # Port -> send time, oldest first
+        pending = iter(ports)
+        exhausted = False
+        next_send = 0.0
+        
+        def record(port: int, state: PortState, scan_time: float, error: Optional[str] = None):
+            result = ScanResult(
+                host=host,
+                port=port,
+                state=state,
+                service=self._get_service_name(port) if state is PortState.OPEN else None,
+                scan_time=scan_time,
+                error=error
+            )
+            host_results.append(result)
+            
+            if verbose and state is PortState.OPEN:
+                print(f"[+] {result.host}:{result.port} - {result.state.value}")
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER)
+            
+            while True:
+                # Top up the window of outstanding SYNs, spaced out by the delay
+                now = time.time()
+                while not exhausted and len(outstanding) < window and now >= next_send:
+                    port = next(pending, None)
+                    if port is None:
+                        exhausted = True
+                        break
+                    
+                    try:
+                        sock.sendto(_syn_packet(src, dst, sport, port, seq), (host, 0))
+                    except OSError as e:
+                        record(port, PortState.UNKNOWN, 0.0, str(e))
+                        continue
+                    
+                    outstanding[port] = now
+                    if delay > 0:
+                        next_send = now + delay
+                
+                if not outstanding:
+                    if exhausted:
+                        break
+                    time.sleep(max(0.0, next_send - time.time()))
+                    continue
+                
+                # Sleep until a reply arrives, the oldest probe expires or the next send is due
+                wait = next(iter(outstanding.values())) + timeout - time.time()
+                if not exhausted and len(outstanding) < window:
+                    wait = min(wait, next_send - time.time())
+                readable, _, _ = select.select([sock], [], [], max(0.0, wait))
+                
+                # Drain every queued reply and match it to an outstanding probe
+                while readable:
+                    try:
+                        packet = sock.recv(65535, socket.MSG_DONTWAIT)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    
+                    ihl = (packet[0] & 0x0f) * 4
+                    if packet[12:16] != dst or len(packet) < ihl + 14:
+                        continue
+                    
+                    port, reply_dport, _, ack = _TCP_REPLY.unpack_from(packet, ihl)
+                    if reply_dport != sport or ack != expected_ack or port not in outstanding:
+                        continue
+                    
+                    flags = packet[ihl + 13]
+                    if flags & _SYN and flags & _ACK:
+                        state = PortState.OPEN
+                    elif flags & _RST:
+                        state = PortState.CLOSED
+                    else:
+                        continue
+                    record(port, state, time.time() - outstanding.pop(port))
+                
+                # Probes nobody answered in time are filtered
+                now = time.time()
+                while outstanding:
+                    port, sent_at = next(iter(outstanding.items()))
+                    if sent_at + timeout > now:
+                        break
+                    del outstanding[port]
+                    record(port, PortState.FILTERED, now - sent_at, "Timeout")
+        
+        return host_results
+    
+    def _source_address(self, host: str) -> str:
+        """Find the local address the kernel would use to reach host"""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.connect((host, 9))  # No packets are sent for a UDP connect
+            return probe.getsockname()[0]
@@ -3,12 +3,47 @@ TCP Connect Scanner Implementation
 """
 
 import socket
+import struct
 import threading
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..core.models import ScanResult, PortState, ScanConfig
+from ..core.models import ScanResult, PortState, ScanConfig, NetworkUtils
+
+# Service names reported for well-known open ports
+_COMMON_PORTS = {
+    21: "ftp", 22: "ssh", 23: "telnet", 25: "smtp",
+    53: "dns", 80: "http", 110: "pop3", 135: "msrpc",
+    139: "netbios-ssn", 143: "imap", 443: "https",
+    993: "imaps", 995: "pop3s", 1433: "mssql",
+    3306: "mysql", 3389: "rdp", 5432: "postgresql",
+    5900: "vnc", 8080: "http-proxy"
+}
+
+# How banners are grabbed per port; unlisted ports use 'default'
+_BANNER_STRATEGY = {
+    21: 'passive', 22: 'passive', 25: 'passive',  # FTP, SSH and SMTP greet first
+    80: 'http_head',
+    443: 'skip', 993: 'skip', 995: 'skip', 3389: 'skip'  # TLS/RDP send no plaintext banner
+}
+
+# (probe to send, seconds to wait for a reply) for each banner strategy
+_BANNER_PROBES = {
+    'passive': (b"", 0.5),
+    'http_head': (b"HEAD / HTTP/1.0\r\n\r\n", 2.0),
+    'default': (b"\r\n", 2.0),
+    'skip': None
+}
+
+# Drops control characters other than tab, LF and CR from banners in one C pass
+_BANNER_TRANS = str.maketrans({c: None for c in range(32) if c not in (9, 10, 13)})
+
+# SO_LINGER {on, 0s}: close() sends RST instead of leaving the socket in TIME_WAIT
+_LINGER_RESET = struct.pack('ii', 1, 0)
+
+# Linux-only option bounding how long sent data may stay unacknowledged
+_TCP_USER_TIMEOUT = getattr(socket, 'TCP_USER_TIMEOUT', None)
 
 
 class TCPConnectScanner:
@@ -18,22 +53,46 @@ class TCPConnectScanner:
         self.config = config
         self.results = []
         self.lock = threading.Lock()
+        self._dns_cache: Dict[str, str] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None  # Reused across scan_host calls
+    
+    def close(self):
+        """Shut down the worker pool, waiting for outstanding probes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def scan_port(self, host: str, port: int) -> ScanResult:
         """Scan a single port on a host"""
+        try:
+            # Resolve hostname if needed
+            host = self._resolve(host)
+        except Exception as e:
+            return ScanResult(
+                host=host,
+                port=port,
+                state=PortState.UNKNOWN,
+                error=str(e)
+            )
+        
+        return self._scan_ip_port(host, port)
+    
+    def _scan_ip_port(self, host: str, port: int) -> ScanResult:
+        """Scan a single port on an already resolved IP address"""
         start_time = time.time()
         
         try:
-            # Resolve hostname if needed
-            if not self._is_ip_address(host):
-                resolved_ip = socket.gethostbyname(host)
-                if self.config.verbose:
-                    print(f"Resolved {host} to {resolved_ip}")
-                host = resolved_ip
-            
             # Create socket and attempt connection
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            family = socket.AF_INET6 if ':' in host else socket.AF_INET
+            sock = socket.socket(family, socket.SOCK_STREAM)
             sock.settimeout(self.config.timeout)
+            self._tune_socket(sock)
             
             result = sock.connect_ex((host, port))
             scan_time = time.time() - start_time
@@ -81,72 +140,115 @@ class TCPConnectScanner:
     def scan_host(self, host: str, ports: List[int]) -> List[ScanResult]:
         """Scan multiple ports on a single host"""
         host_results = []
+        verbose = self.config.verbose
+        delay = self.config.delay
         
-        with ThreadPoolExecutor(max_workers=self.config.threads) as executor:
-            # Submit all port scan tasks
-            future_to_port = {
-                executor.submit(self.scan_port, host, port): port 
-                for port in ports
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_port):
-                try:
-                    result = future.result()
-                    host_results.append(result)
-                    
-                    if self.config.verbose and result.state == PortState.OPEN:
-                        print(f"[+] {result.host}:{result.port} - {result.state.value}")
+        # Resolve hostname once rather than per port
+        try:
+            host = self._resolve(host)
+        except Exception as e:
+            return self._unresolved_results(host, ports, str(e))
+        
+        # Threads are started once and kept for the following hosts
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.config.threads)
+        
+        # Submit all port scan tasks
+        future_to_port = {
+            self._pool.submit(self._scan_ip_port, host, port): port 
+            for port in ports
+        }
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_port):
+            try:
+                result = future.result()
+                host_results.append(result)
+                
+                if verbose and result.state is PortState.OPEN:
+                    print(f"[+] {result.host}:{result.port} - {result.state.value}")
+                
+                # Add delay if specified
+                if delay > 0:
+                    time.sleep(delay)
                     
-                    # Add delay if specified
-                    if self.config.delay > 0:
-                        time.sleep(self.config.delay)
-                        
-                except Exception as e:
-                    port = future_to_port[future]
-                    print(f"Error scanning {host}:{port} - {e}")
+            except Exception as e:
+                port = future_to_port[future]
+                print(f"Error scanning {host}:{port} - {e}")
         
         return host_results
     
+    def _tune_socket(self, sock):
+        """Apply socket options suited to short-lived probe connections"""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+            if _TCP_USER_TIMEOUT is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, _TCP_USER_TIMEOUT,
+                                int(self.config.timeout * 1000))
+        except OSError:
+            pass  # Options are an optimisation only
+    
+    def _unresolved_results(self, host: str, ports: List[int], error: str) -> List[ScanResult]:
+        """Report every port as UNKNOWN for a host that could not be resolved"""
+        return [
+            ScanResult(host=host, port=port, state=PortState.UNKNOWN, error=error)
+            for port in ports
+        ]
+    
+    def _resolve(self, host: str) -> str:
+        """Resolve hostname to IP address, caching the answer for this scanner
+        
+        IPv4 and IPv6 literals are returned unchanged.
+        """
+        if self._is_ip_address(host):
+            return host
+        
+        with self.lock:
+            resolved_ip = self._dns_cache.get(host)
+        if resolved_ip is None:
+            resolved_ip = socket.gethostbyname(host)
+            with self.lock:
+                self._dns_cache[host] = resolved_ip
+            if self.config.verbose:
+                print(f"Resolved {host} to {resolved_ip}")
+        
+        return resolved_ip
+    
     def _grab_banner(self, sock: socket.socket, port: int) -> Optional[str]:
         """Attempt to grab banner from open port"""
+        plan = self._banner_probe(port)
+        if plan is None:
+            return None
+        
         try:
             # Send appropriate probe based on port
-            if port == 80:
-                sock.send(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-            elif port == 21:
-                pass  # FTP sends banner immediately
-            elif port == 22:
-                pass  # SSH sends banner immediately
-            elif port == 25:
-                pass  # SMTP sends banner immediately
-            else:
-                sock.send(b"\r\n")
+            probe, timeout = plan
+            if probe:
+                sock.send(probe)
             
             # Try to receive banner
-            sock.settimeout(2.0)
-            banner = sock.recv(1024).decode('utf-8', errors='ignore').strip()
-            return banner[:200] if banner else None  # Limit banner length
+            sock.settimeout(timeout)
+            return self._clean_banner(sock.recv(1024))
             
         except:
             return None
     
+    def _clean_banner(self, data) -> Optional[str]:
+        """Decode a received banner (bytes or memoryview), dropping control characters"""
+        banner = str(data, 'utf-8', 'ignore').translate(_BANNER_TRANS).strip()
+        return banner[:200] if banner else None  # Limit banner length
+    
+    def _banner_probe(self, port: int) -> Optional[Tuple[bytes, float]]:
+        """Get the probe to send and the reply timeout for a port's banner
+        
+        Returns None for ports whose banner is not worth waiting for.
+        """
+        return _BANNER_PROBES[_BANNER_STRATEGY.get(port, 'default')]
+    
     def _get_service_name(self, port: int) -> Optional[str]:
         """Get common service name for port"""
-        common_ports = {
-            21: "ftp", 22: "ssh", 23: "telnet", 25: "smtp",
-            53: "dns", 80: "http", 110: "pop3", 135: "msrpc",
-            139: "netbios-ssn", 143: "imap", 443: "https",
-            993: "imaps", 995: "pop3s", 1433: "mssql",
-            3306: "mysql", 3389: "rdp", 5432: "postgresql",
-            5900: "vnc", 8080: "http-proxy"
-        }
-        return common_ports.get(port)
+        return _COMMON_PORTS.get(port)
     
     def _is_ip_address(self, host: str) -> bool:
-        """Check if host is an IP address"""
-        try:
-            socket.inet_aton(host)
-            return True
-        except socket.error:
-            return False
+        """Check if host is an IPv4 or IPv6 address"""
+        return NetworkUtils.is_valid_ip(host)
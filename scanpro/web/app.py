@@ -2,30 +2,149 @@
 Flask web interface for ScanPro
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, render_template, request, jsonify, redirect, url_for, Response, stream_with_context
+from werkzeug.http import generate_etag
+import ipaddress
 import json
+import sys
 import threading
 import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 import uuid
 
-from ..core.models import ScanConfig, ScanType, NetworkUtils
+from ..core.models import ScanConfig, PortState, HostResult, NetworkUtils
 from ..controller.scan_controller import ScanController
 from ..config.profiles import ScanProfiles, PortPresets
+from ..reporting.reporters import dumps_json_line
+
+# Optional C JSON encoder for API responses and result downloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pluggable JSON providers arrived in Flask 2.2
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    DefaultJSONProvider = None
+
+# Slotted dataclasses where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Port states compared by identity when bucketing results
+_OPEN = PortState.OPEN
+_CLOSED = PortState.CLOSED
+
+
+# Safe local targets (localhost + common VM/lab networks)
+SAFE_HOSTS = {'127.0.0.1', '::1', 'localhost'}
+SAFE_NETWORKS = [
+    # VirtualBox default ranges
+    '192.168.56.0/24',  # VirtualBox Host-Only
+    # VMware default ranges
+    '192.168.1.0/24',   # VMware NAT
+    '192.168.57.0/24',  # VMware Host-Only
+    # Docker ranges
+    '172.17.0.0/16',    # Docker default bridge
+    # Common lab ranges
+    '10.0.0.0/24',      # Common lab network
+    '192.168.0.0/24',   # Home router default
+]
+
+# Safe networks precompiled to (network, netmask, version) integers
+_SAFE_NETS = [
+    (int(network.network_address), int(network.netmask), network.version)
+    for network in map(ipaddress.ip_network, SAFE_NETWORKS)
+]
+
+
+def _is_safe_target(target: str) -> bool:
+    """Check if a target is localhost or inside a safe VM/lab network"""
+    if target in SAFE_HOSTS:
+        return True
+    
+    try:
+        ip = ipaddress.ip_address(target)
+    except ValueError:
+        # Not a valid IP, treat as potentially unsafe
+        return False
+    
+    value = int(ip)
+    return any(
+        version == ip.version and value & netmask == network
+        for network, netmask, version in _SAFE_NETS
+    )
+
+
+if orjson is not None and DefaultJSONProvider is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider that encodes and decodes with orjson"""
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+        
+        def loads(self, s, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+else:
+    OrjsonProvider = None
+
+
+def _scan_target(config: ScanConfig) -> List[HostResult]:
+    """Run a single-target scan; executed in the web app's worker processes"""
+    return ScanController(config).execute_scan()
+
+
+@dataclass(**_SLOTS)
+class ScanProgress:
+    """Status and progress of a web-initiated scan"""
+    id: str
+    start_time: str
+    config: Dict[str, Any]
+    total_ports: int
+    status: str = 'starting'
+    progress: int = 0
+    scanned_ports: int = 0
+    current_target: Optional[str] = None
+    results: Optional[Dict[str, Any]] = None
+    end_time: Optional[str] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a shallow dict for JSON responses"""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
 
 
 class ScanProWeb:
     """Web interface for ScanPro"""
     
-    def __init__(self):
+    # Seconds a /api/scans body may be reused by ?cached=1 polls
+    SCANS_CACHE_TTL = 2.0
+    
+    def __init__(self, worker_pool: Optional[Executor] = None, pool_workers: int = 1):
         self.app = Flask(__name__, 
                         template_folder='templates',
                         static_folder='static')
         self.app.secret_key = 'scanpro-web-interface-key'
         
-        # Store active scans
-        self.active_scans = {}
-        self.completed_scans = {}
+        # jsonify() encodes scan tables in C when orjson is available
+        if OrjsonProvider is not None:
+            self.app.json = OrjsonProvider(self.app)
+        
+        # Store active scans; the lock guards moving a scan between the two
+        self.active_scans: Dict[str, ScanProgress] = {}
+        self.completed_scans: Dict[str, ScanProgress] = {}
+        self._scans_lock = threading.Lock()
+        self._scans_cache = None  # (expiry time, /api/scans response body)
+        self._index_page = None  # (ETag, rendered dashboard HTML)
+        
+        # Optional process pool that multi-target scans fan out over, one task per target
+        # pool_workers is its process count, which the form's thread limit is shared across
+        self.worker_pool = worker_pool
+        self.pool_workers = max(1, pool_workers)
         
         self._setup_routes()
     
@@ -34,10 +153,22 @@ class ScanProWeb:
         
         @self.app.route('/')
         def index():
-            """Main dashboard page"""
-            return render_template('index.html',
-                                 profiles=ScanProfiles.list_profiles(),
-                                 presets=PortPresets.list_presets())
+            """Main dashboard page
+            
+            Profiles and presets never change at runtime, so the page is
+            rendered once and browser refreshes revalidate it by ETag.
+            """
+            if self._index_page is None:
+                html = render_template('index.html',
+                                     profiles=ScanProfiles.list_profiles(),
+                                     presets=PortPresets.list_presets()).encode('utf-8')
+                self._index_page = (generate_etag(html), html)
+            
+            etag, html = self._index_page
+            response = self.app.response_class(html, mimetype='text/html')
+            response.set_etag(etag)
+            response.cache_control.no_cache = True  # Always revalidate, usually getting a 304
+            return response.make_conditional(request)
         
         @self.app.route('/scan', methods=['POST'])
         def start_scan():
@@ -47,52 +178,15 @@ class ScanProWeb:
                 targets = request.form.get('targets', '127.0.0.1')
                 ports = request.form.get('ports', 'top20')
                 profile = request.form.get('profile', 'default')
+                profile_config = ScanProfiles.get_profile(profile)
                 timeout = float(request.form.get('timeout', 3.0))
-                threads = int(request.form.get('threads', 100))
+                threads = max(1, min(int(request.form.get('threads', 100)), 1000))  # Same limits as the CLI
                 
                 # Safety check for non-localhost targets
-                target_list = NetworkUtils.parse_targets(targets)
-                
-                # Define safe local ranges (localhost + common VM/lab networks)
-                safe_ranges = {
-                    '127.0.0.1', '::1', 'localhost',
-                    # VirtualBox default ranges
-                    '192.168.56.0/24',  # VirtualBox Host-Only
-                    # VMware default ranges  
-                    '192.168.1.0/24',   # VMware NAT
-                    '192.168.57.0/24',  # VMware Host-Only
-                    # Docker ranges
-                    '172.17.0.0/16',    # Docker default bridge
-                    # Common lab ranges
-                    '10.0.0.0/24',      # Common lab network
-                    '192.168.0.0/24',   # Home router default
-                }
+                target_list = NetworkUtils.deduplicate_targets(NetworkUtils.parse_targets(targets))
                 
                 # Check which targets are outside safe ranges
-                potentially_unsafe = []
-                for target in target_list:
-                    if target in ['127.0.0.1', '::1', 'localhost']:
-                        continue
-                    
-                    # Check if target is in a safe VM/lab range
-                    is_safe = False
-                    try:
-                        import ipaddress
-                        target_ip = ipaddress.ip_address(target)
-                        for safe_range in safe_ranges:
-                            if '/' in safe_range:
-                                if target_ip in ipaddress.ip_network(safe_range, strict=False):
-                                    is_safe = True
-                                    break
-                            elif target == safe_range:
-                                is_safe = True
-                                break
-                    except ValueError:
-                        # Not a valid IP, treat as potentially unsafe
-                        pass
-                    
-                    if not is_safe:
-                        potentially_unsafe.append(target)
+                potentially_unsafe = [target for target in target_list if not _is_safe_target(target)]
                 
                 # Check if user confirmed scanning potentially unsafe targets
                 if potentially_unsafe:
@@ -115,33 +209,29 @@ class ScanProWeb:
                 config = ScanConfig(
                     targets=target_list,
                     ports=port_list,
-                    scan_type=ScanType.TCP_CONNECT,
+                    scan_type=profile_config['scan_type'],
                     timeout=timeout,
                     threads=threads,
-                    verbose=False
+                    verbose=False,
+                    legacy_threads=profile_config.get('legacy_threads', False)
                 )
                 
                 # Generate scan ID
                 scan_id = str(uuid.uuid4())[:8]
                 
                 # Store scan info
-                scan_info = {
-                    'id': scan_id,
-                    'status': 'starting',
-                    'start_time': datetime.now().isoformat(),
-                    'config': {
+                scan_info = ScanProgress(
+                    id=scan_id,
+                    start_time=datetime.now().isoformat(),
+                    config={
                         'targets': target_list,
                         'ports': len(port_list),
                         'profile': profile,
                         'timeout': timeout,
                         'threads': threads
                     },
-                    'results': None,
-                    'progress': 0,
-                    'total_ports': len(port_list) * len(target_list),
-                    'scanned_ports': 0,
-                    'current_target': None
-                }
+                    total_ports=len(port_list) * len(target_list)
+                )
                 
                 self.active_scans[scan_id] = scan_info
                 
@@ -168,10 +258,11 @@ class ScanProWeb:
         @self.app.route('/scan/<scan_id>/status')
         def scan_status(scan_id):
             """Get scan status"""
-            if scan_id in self.active_scans:
-                return jsonify(self.active_scans[scan_id])
-            elif scan_id in self.completed_scans:
-                return jsonify(self.completed_scans[scan_id])
+            with self._scans_lock:
+                scan_info = self.active_scans.get(scan_id) or self.completed_scans.get(scan_id)
+            
+            if scan_info is not None:
+                return jsonify(scan_info.to_dict())
             else:
                 return jsonify({'error': 'Scan not found'}), 404
         
@@ -182,103 +273,152 @@ class ScanProWeb:
                 scan_info = self.completed_scans[scan_id]
                 return render_template('results.html', 
                                      scan=scan_info,
-                                     results=scan_info['results'])
+                                     results=scan_info.results)
             else:
                 return redirect(url_for('index'))
         
         @self.app.route('/api/scans')
         def list_scans():
-            """API endpoint to list all scans"""
-            all_scans = {}
-            all_scans.update(self.active_scans)
-            all_scans.update(self.completed_scans)
-            return jsonify(all_scans)
+            """API endpoint to list all scans
+            
+            Polls passing ?cached=1 may get a body up to SCANS_CACHE_TTL old.
+            """
+            if request.args.get('cached') == '1':
+                cache = self._scans_cache
+                if cache is not None and time.time() < cache[0]:
+                    return self.app.response_class(cache[1], mimetype='application/json')
+            
+            with self._scans_lock:
+                all_scans = {**self.active_scans, **self.completed_scans}
+            response = jsonify({scan_id: scan_info.to_dict() for scan_id, scan_info in all_scans.items()})
+            
+            self._scans_cache = (time.time() + self.SCANS_CACHE_TTL, response.get_data())
+            return response
         
         @self.app.route('/api/scan/<scan_id>/download')
         def download_results(scan_id):
             """Download scan results as JSON"""
             if scan_id in self.completed_scans:
                 scan_info = self.completed_scans[scan_id]
-                results = scan_info['results']
+                results = scan_info.results
+                
+                # Encode in C when orjson is installed; either way the body is
+                # built in one piece so it is sent with a Content-Length
+                if orjson is not None:
+                    body = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+                else:
+                    body = json.dumps(results, indent=2)
                 
-                from flask import Response
                 response = Response(
-                    json.dumps(results, indent=2),
+                    body,
                     mimetype='application/json',
                     headers={'Content-Disposition': f'attachment;filename=scanpro_results_{scan_id}.json'}
                 )
                 return response
             else:
                 return jsonify({'error': 'Scan not found'}), 404
+        
+        @self.app.route('/api/scan/<scan_id>/stream')
+        def stream_results(scan_id):
+            """Stream scan results as NDJSON, one host per line"""
+            if scan_id not in self.completed_scans:
+                return jsonify({'error': 'Scan not found'}), 404
+            
+            results = self.completed_scans[scan_id].results
+            if results is None:
+                return jsonify({'error': 'Scan has no results'}), 409
+            
+            hosts = results['hosts']
+            
+            def generate():
+                for host_data in hosts:
+                    yield dumps_json_line(host_data) + '\n'
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
     
     def _run_scan_background(self, scan_id, config):
         """Run scan in background thread"""
+        # Single field writes are atomic, so progress updates need no lock
+        scan_info = self.active_scans[scan_id]
+        
         try:
             # Update status to running
-            self.active_scans[scan_id]['status'] = 'running'
-            self.active_scans[scan_id]['progress'] = 5
-            
-            # Execute scan with progress updates
-            controller = ScanController(config)
+            scan_info.status = 'running'
+            scan_info.progress = 5
             
             # Update status to scanning
-            self.active_scans[scan_id]['status'] = 'scanning' 
-            self.active_scans[scan_id]['progress'] = 10
+            scan_info.status = 'scanning'
+            scan_info.progress = 10
             
-            # Track progress during scan
             total_targets = len(config.targets)
-            for i, target in enumerate(config.targets):
-                self.active_scans[scan_id]['current_target'] = target
-                self.active_scans[scan_id]['progress'] = 10 + (i * 80 // total_targets)
-            
-            # Execute the actual scan
-            results = controller.execute_scan()
+            if self.worker_pool is not None and total_targets > 1:
+                # Scan targets in parallel processes, splitting the thread limit between
+                # the targets in flight so the total concurrency stays as configured
+                in_flight = min(self.pool_workers, total_targets)
+                target_threads = max(1, config.threads // in_flight)
+                futures = [
+                    self.worker_pool.submit(_scan_target, replace(config, targets=[target], threads=target_threads))
+                    for target in config.targets
+                ]
+                
+                # Report the oldest unfinished target while waiting on it, in target order
+                results = []
+                try:
+                    for i, (target, future) in enumerate(zip(config.targets, futures), 1):
+                        scan_info.current_target = target
+                        results.extend(future.result())
+                        scan_info.progress = 10 + (i * 80 // total_targets)
+                finally:
+                    for future in futures:
+                        future.cancel()
+            else:
+                # Execute scan with progress updates
+                controller = ScanController(config)
+                
+                # Track progress during scan
+                for i, target in enumerate(config.targets):
+                    scan_info.current_target = target
+                    scan_info.progress = 10 + (i * 80 // total_targets)
+                
+                # Execute the actual scan
+                results = controller.execute_scan()
             
             # Update progress to processing
-            self.active_scans[scan_id]['status'] = 'processing'
-            self.active_scans[scan_id]['progress'] = 90
+            scan_info.status = 'processing'
+            scan_info.progress = 90
             
             # Process results for web display
-            processed_results = self._process_results(results)
-            
-            # Move to completed scans
-            scan_info = self.active_scans.pop(scan_id)
-            scan_info.update({
-                'status': 'completed',
-                'end_time': datetime.now().isoformat(),
-                'results': processed_results,
-                'progress': 100,
-                'current_target': None
-            })
-            
-            self.completed_scans[scan_id] = scan_info
+            scan_info.results = self._process_results(results)
+            scan_info.end_time = datetime.now().isoformat()
+            scan_info.current_target = None
+            scan_info.progress = 100
+            status = 'completed'
             
         except Exception as e:
             # Handle scan error
-            if scan_id in self.active_scans:
-                scan_info = self.active_scans.pop(scan_id)
-                scan_info.update({
-                    'status': 'error',
-                    'end_time': datetime.now().isoformat(),
-                    'error': str(e),
-                    'progress': 0,
-                    'current_target': None
-                })
-                self.completed_scans[scan_id] = scan_info
+            scan_info.end_time = datetime.now().isoformat()
+            scan_info.error = str(e)
+            scan_info.current_target = None
+            scan_info.progress = 0
+            status = 'error'
+        
+        # Move to completed scans, publishing the final status at the same time
+        with self._scans_lock:
+            scan_info.status = status
+            self.completed_scans[scan_id] = self.active_scans.pop(scan_id)
     
     def _process_results(self, host_results):
         """Process scan results for web display"""
-        processed = {
-            'summary': {
-                'total_hosts': len(host_results),
-                'live_hosts': len([h for h in host_results if h.is_alive]),
-                'total_ports': sum(len(h.ports) for h in host_results),
-                'open_ports': sum(len([p for p in h.ports if p.state.value == 'open']) for h in host_results)
-            },
-            'hosts': []
-        }
+        processed = {'summary': None, 'hosts': []}
+        
+        # Summary counters are gathered in the same pass that buckets ports
+        live_hosts = total_ports = open_count = 0
         
         for host_result in host_results:
+            if host_result.is_alive:
+                live_hosts += 1
+            total_ports += len(host_result.ports)
+            
             host_data = {
                 'host': host_result.host,
                 'is_alive': host_result.is_alive,
@@ -287,6 +427,9 @@ class ScanProWeb:
                 'closed_ports': [],
                 'filtered_ports': []
             }
+            open_ports = host_data['open_ports']
+            closed_ports = host_data['closed_ports']
+            filtered_ports = host_data['filtered_ports']
             
             for port_result in host_result.ports:
                 port_data = {
@@ -296,26 +439,41 @@ class ScanProWeb:
                     'scan_time': port_result.scan_time
                 }
                 
-                if port_result.state.value == 'open':
-                    host_data['open_ports'].append(port_data)
-                elif port_result.state.value == 'closed':
-                    host_data['closed_ports'].append(port_data)
+                state = port_result.state
+                if state is _OPEN:
+                    open_ports.append(port_data)
+                elif state is _CLOSED:
+                    closed_ports.append(port_data)
                 else:
-                    host_data['filtered_ports'].append(port_data)
+                    filtered_ports.append(port_data)
             
+            open_count += len(open_ports)
             processed['hosts'].append(host_data)
         
+        processed['summary'] = {
+            'total_hosts': len(host_results),
+            'live_hosts': live_hosts,
+            'total_ports': total_ports,
+            'open_ports': open_count
+        }
+        
         return processed
     
     def run(self, host='127.0.0.1', port=5000, debug=False):
         """Run the Flask web server"""
-        print(f"🌐 Starting ScanPro Web Server...")
-        print(f"📍 Access at: http://{host}:{port}")
-        print(f"🛡️  Safe targets: localhost, VMs (192.168.x.x), lab networks")
-        print(f"⚠️  External targets require ownership confirmation")
-        print("-" * 60)
+        self.print_banner(host, port)
         
         self.app.run(host=host, port=port, debug=debug, threaded=True)
+    
+    def print_banner(self, host='127.0.0.1', port=5000):
+        """Print the startup banner"""
+        print("\n".join([
+            f"🌐 Starting ScanPro Web Server...",
+            f"📍 Access at: http://{host}:{port}",
+            f"🛡️  Safe targets: localhost, VMs (192.168.x.x), lab networks",
+            f"⚠️  External targets require ownership confirmation",
+            "-" * 60
+        ]), flush=True)
 
 
 def create_app():
@@ -1,41 +1,243 @@
 #!/usr/bin/env python3
 """
 ScanPro Web Interface Launcher
+
+Deployments running their own gunicorn can skip this launcher and
+point it at wsgi:app instead.
 """
 
-import sys
 import os
 
+# Opt-in gevent mode: patch the stdlib before anything else imports socket
+if os.environ.get('SCANPRO_GEVENT'):
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        print("⚠️  SCANPRO_GEVENT is set but gevent is not installed: pip install gevent")
+
+import gc
+import logging
+import multiprocessing
+import platform
+import signal
+import socket
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 # Add the scanpro directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from scanpro.web.app import ScanProWeb
-except ImportError as e:
-    print("Error: Flask is required for the web interface")
-    print("Install Flask with: pip install flask")
-    print(f"Import error: {e}")
-    sys.exit(1)
+HOST = '127.0.0.1'
+PORT = 5000
+
+# Pending connections the listening socket queues before refusing SYNs
+LISTEN_BACKLOG = 4096
+
+# Processes in the pool that multi-target web scans are spread over
+SCAN_WORKERS = os.cpu_count() or 1
+
+logger = logging.getLogger('scanpro')
+
+IS_PYPY = platform.python_implementation() == 'PyPy'
+
+# Startup banner, written to stdout in one go
+BANNER = (
+    "ScanPro Web Interface\n"
+    + "=" * 40 + "\n"
+    "Professional TCP Port Scanner\n"
+    "CLI + Web Dashboard | VM Support | Auto-Refresh\n"
+    "\n"
+)
+
+# Logged with the ImportError when Flask or the scanner stack cannot be imported
+FLASK_MISSING_MSG = "Flask is required for the web interface (pip install flask): %s"
+
+
+def gunicorn_options():
+    """Gunicorn settings for the web interface
+    
+    Scan progress lives in the ScanProWeb instance, so a single worker
+    process serves every request and concurrency comes from its threads.
+    SO_REUSEPORT (gunicorn's reuse_port) is deliberately left off: spreading
+    connections across processes or launcher instances would send status
+    polls to processes that never saw the scan.
+    
+    The app is built in the master (preload_app), so the forked worker
+    shares its pages copy-on-write. gunicorn itself sets TCP_NODELAY on the
+    listener, which accepted connections inherit.
+    """
+    return {
+        'bind': f'{HOST}:{PORT}',
+        'workers': 1,
+        'worker_class': 'gthread',
+        'threads': (os.cpu_count() or 1) * 2 + 1,
+        'keepalive': 2,
+        'backlog': LISTEN_BACKLOG,
+        'preload_app': True
+    }
+
+
+def _init_worker():
+    """Leave Ctrl-C to the launcher, which shuts the scan pool down"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def scan_worker_pool():
+    """Process pool that web scans fan their targets out over
+    
+    SCAN_WORKERS processes (one per CPU), each free of the server's GIL. Processes are
+    spawned rather than forked, since the servers fork or run threads, and
+    only start when a multi-target scan first needs them. Returns None in
+    gevent mode, whose patched threading the pool cannot rely on.
+    """
+    if os.environ.get('SCANPRO_GEVENT'):
+        return None
+    return ProcessPoolExecutor(max_workers=SCAN_WORKERS,
+                               mp_context=multiprocessing.get_context('spawn'),
+                               initializer=_init_worker)
+
+
+def warm_templates(web_app):
+    """Compile every Jinja template up front, caching the bytecode on disk
+    
+    Templates are compiled before any server forks its workers, and later
+    launches load the cached bytecode instead of parsing the sources again.
+    """
+    from jinja2 import FileSystemBytecodeCache
+    
+    jinja_env = web_app.app.jinja_env
+    jinja_env.bytecode_cache = FileSystemBytecodeCache(pattern='scanpro-%s.cache')
+    for name in jinja_env.list_templates():
+        jinja_env.get_template(name)
+
+
+def run_gunicorn(web_app):
+    """Serve the Flask app with an embedded gunicorn server
+    
+    gunicorn is only imported here, keeping it out of plain imports of this
+    module such as the scan pool's spawned workers. Returns False if
+    gunicorn is not installed.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        return False
+    
+    class GunicornServer(BaseApplication):
+        """Embedded gunicorn server hosting the ScanPro Flask app"""
+        
+        def __init__(self, app, options=None):
+            self.application = app
+            self.options = options or {}
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+        
+        def load(self):
+            return self.application
+    
+    web_app.print_banner(HOST, PORT)
+    # Keep the GC from touching startup objects, which would copy their pages after fork
+    gc.freeze()
+    GunicornServer(web_app.app, gunicorn_options()).run()
+    return True
+
+
+def run_asgi(web_app):
+    """Serve the Flask app from uvicorn's event loop via asgiref's WSGI adapter
+    
+    WsgiToAsgi hands each request to a worker thread, so blocking Flask
+    handlers never stall the loop. Returns False if asgiref or uvicorn is
+    not installed.
+    """
+    try:
+        from asgiref.wsgi import WsgiToAsgi
+        import uvicorn
+    except ImportError:
+        return False
+    
+    web_app.print_banner(HOST, PORT)
+    uvicorn.run(WsgiToAsgi(web_app.app), host=HOST, port=PORT,
+                loop='auto', http='auto', workers=1, backlog=LISTEN_BACKLOG,
+                log_level='warning')
+    return True
+
+
+def run_gevent(web_app):
+    """Serve the Flask app with gevent's WSGI server
+    
+    Returns False unless gevent was installed and patched in at startup.
+    """
+    try:
+        from gevent import monkey
+        from gevent.pywsgi import WSGIServer
+    except ImportError:
+        return False
+    if not monkey.is_module_patched('socket'):
+        return False
+    
+    # Small JSON replies go out at once; accepted sockets inherit TCP_NODELAY
+    listener = socket.create_server((HOST, PORT), backlog=LISTEN_BACKLOG)
+    listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    web_app.print_banner(HOST, PORT)
+    server = WSGIServer(listener, web_app.app)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+        raise
+    return True
+
 
 def main():
     """Main entry point for web interface"""
-    print("ScanPro Web Interface")
-    print("=" * 40)
-    print("Professional TCP Port Scanner")
-    print("CLI + Web Dashboard | VM Support | Auto-Refresh")
-    print()
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    
+    # Optional C extensions (orjson, pytricia) are skipped automatically on PyPy
+    if IS_PYPY:
+        logger.info("🐍 Running on PyPy %s", platform.python_version())
+        if not os.environ.get('SCANPRO_GEVENT'):
+            logger.info("💡 PyPy pairs well with gevent: SCANPRO_GEVENT=1 python web_server.py")
+    
+    # Flask and the scanner stack are only imported once the server is starting
+    try:
+        from scanpro.web.app import ScanProWeb
+    except ImportError as e:
+        logger.error(FLASK_MISSING_MSG, e)
+        sys.exit(1)
     
     # Create web application
-    web_app = ScanProWeb()
+    worker_pool = scan_worker_pool()
+    web_app = ScanProWeb(worker_pool=worker_pool, pool_workers=SCAN_WORKERS)
+    warm_templates(web_app)
     
-    # Run the server
+    # Run the server, preferring gunicorn over Flask's development server
     try:
-        web_app.run(host='127.0.0.1', port=5000, debug=False)
+        if os.environ.get('SCANPRO_GEVENT') and run_gevent(web_app):
+            return
+        
+        if '--asgi' in sys.argv[1:]:
+            if run_asgi(web_app):
+                return
+            logger.warning("⚠️  --asgi needs asgiref and uvicorn: pip install asgiref uvicorn")
+        
+        if not run_gunicorn(web_app):
+            web_app.run(host=HOST, port=PORT, debug=False)
     except KeyboardInterrupt:
-        print("\n👋 ScanPro Web Interface stopped")
-    except Exception as e:
-        print(f"❌ Error starting web server: {e}")
-        print("Make sure Flask is installed: pip install flask")
+        logger.info("👋 ScanPro Web Interface stopped")
+    except Exception:
+        logger.exception("❌ Error starting web server")
+    finally:
+        if worker_pool is not None:
+            worker_pool.shutdown(wait=False)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,20 @@
+"""
+ScanPro WSGI Entry Point
+
+Lets an external WSGI server host the web interface without the
+web_server.py launcher, e.g.:
+
+    gunicorn --preload --workers 1 --worker-class gthread --threads 8 wsgi:app
+
+Keep a single worker: scan progress lives in the one ScanProWeb instance.
+"""
+
+import gc
+
+from scanpro.web.app import create_app
+
+app = create_app()
+
+# With --preload the app is built in the master; freezing keeps the GC
+# from dirtying its pages in the forked worker
+gc.freeze()